@@ -6,10 +6,15 @@ running in Docker alongside the MCP server.
 """
 
 import asyncio
+import hashlib
+import json
 from contextlib import asynccontextmanager
-from typing import Optional, List, Union
+from typing import Any, Optional, List, Union
 
-from fastapi import FastAPI, HTTPException, Query
+import msgpack
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from telegram_core import telegram
@@ -85,8 +90,9 @@ class SaveDraftRequest(BaseModel):
 
 class ApiResponse(BaseModel):
     success: bool
-    data: Optional[str] = None
+    data: Optional[Any] = None
     error: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 
 # ==================== FastAPI App ====================
@@ -109,14 +115,57 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# List endpoints return JSON that compresses well; small acks stay uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 def make_response(result: str) -> ApiResponse:
     """Create a standardized API response."""
     if result.startswith("An error occurred") or "Error" in result[:50]:
         return ApiResponse(success=False, error=result)
+    # Embed JSON results natively so clients parse the payload only once
+    if result[:1] in ("{", "["):
+        try:
+            return ApiResponse(success=True, data=json.loads(result))
+        except ValueError:
+            pass
     return ApiResponse(success=True, data=result)
 
 
+def make_etag_response(result: str, if_none_match: Optional[str]):
+    """Create a response with an ETag, or a bodiless 304 if the client's copy is current."""
+    response = make_response(result)
+    if not response.success:
+        return response
+    body = response.model_dump_json().encode()
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def make_list_response(result: str, accept: Optional[str]):
+    """Encode list results as JSON Lines or MessagePack when the client accepts them."""
+    if accept and NDJSON_MEDIA_TYPE in accept and result[:1] == "[":
+        try:
+            rows = json.loads(result)
+        except ValueError:
+            rows = None
+        if isinstance(rows, list):
+            return StreamingResponse(
+                (json.dumps(row) + "\n" for row in rows), media_type=NDJSON_MEDIA_TYPE
+            )
+    if accept and MSGPACK_MEDIA_TYPE in accept:
+        return Response(
+            msgpack.packb(make_response(result).model_dump()), media_type=MSGPACK_MEDIA_TYPE
+        )
+    return make_response(result)
+
+
 # ==================== Health Check ====================
 
 @app.get("/health")
@@ -149,14 +198,14 @@ async def list_chats(
 
 
 @app.get("/chats/{chat_id}", response_model=ApiResponse)
-async def get_chat(chat_id: str):
+async def get_chat(chat_id: str, if_none_match: Optional[str] = Header(None)):
     """Get detailed information about a specific chat."""
     try:
         parsed_id = int(chat_id)
     except ValueError:
         parsed_id = chat_id
     result = await telegram.get_chat(parsed_id)
-    return make_response(result)
+    return make_etag_response(result, if_none_match)
 
 
 # ==================== Message Endpoints ====================
@@ -166,14 +215,33 @@ async def get_messages(
     chat_id: str,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
 ):
-    """Get paginated messages from a chat."""
+    """
+    Get paginated messages from a chat.
+
+    The first page and any request with a cursor use keyset pagination and
+    return next_cursor, an opaque token for the following page.
+    """
     try:
         parsed_id = int(chat_id)
     except ValueError:
         parsed_id = chat_id
-    result = await telegram.get_messages(parsed_id, page=page, page_size=page_size)
-    return make_response(result)
+    if cursor is None and page > 1:
+        result = await telegram.get_messages(parsed_id, page=page, page_size=page_size)
+        return make_response(result)
+
+    try:
+        offset_id = int(cursor) if cursor is not None else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    result, next_offset_id = await telegram.get_messages_page(
+        parsed_id, page_size=page_size, offset_id=offset_id
+    )
+    response = make_response(result)
+    if response.success and next_offset_id is not None:
+        response.next_cursor = str(next_offset_id)
+    return response
 
 
 @app.post("/messages/send", response_model=ApiResponse)
@@ -222,7 +290,7 @@ async def forward_message(request: ForwardMessageRequest):
 
 
 @app.post("/messages/search", response_model=ApiResponse)
-async def search_messages(request: SearchMessagesRequest):
+async def search_messages(request: SearchMessagesRequest, accept: Optional[str] = Header(None)):
     """Search for messages in a chat."""
     result = await telegram.search_messages(
         chat_id=request.chat_id,
@@ -230,16 +298,20 @@ async def search_messages(request: SearchMessagesRequest):
         limit=request.limit,
         from_user=request.from_user,
     )
-    return make_response(result)
+    return make_list_response(result, accept)
 
 
 # ==================== Contact Endpoints ====================
 
 @app.get("/contacts", response_model=ApiResponse)
-async def list_contacts():
+async def list_contacts(
+    accept: Optional[str] = Header(None), if_none_match: Optional[str] = Header(None)
+):
     """Get all contacts."""
     result = await telegram.list_contacts()
-    return make_response(result)
+    if accept and (NDJSON_MEDIA_TYPE in accept or MSGPACK_MEDIA_TYPE in accept):
+        return make_list_response(result, accept)
+    return make_etag_response(result, if_none_match)
 
 
 @app.get("/contacts/search", response_model=ApiResponse)
@@ -292,10 +364,10 @@ async def get_user_status(user_id: str):
 
 
 @app.get("/resolve/{username}", response_model=ApiResponse)
-async def resolve_username(username: str):
+async def resolve_username(username: str, if_none_match: Optional[str] = Header(None)):
     """Resolve a username to get entity information."""
     result = await telegram.resolve_username(username)
-    return make_response(result)
+    return make_etag_response(result, if_none_match)
 
 
 # ==================== Group Endpoints ====================
@@ -330,6 +402,7 @@ async def get_participants(
     chat_id: str,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    accept: Optional[str] = Header(None),
 ):
     """Get participants of a group or channel."""
     try:
@@ -337,20 +410,20 @@ async def get_participants(
     except ValueError:
         parsed_id = chat_id
     result = await telegram.get_participants(parsed_id, limit=limit, offset=offset)
-    return make_response(result)
+    return make_list_response(result, accept)
 
 
 # ==================== Admin Endpoints ====================
 
 @app.get("/chats/{chat_id}/admins", response_model=ApiResponse)
-async def get_admins(chat_id: str):
+async def get_admins(chat_id: str, if_none_match: Optional[str] = Header(None)):
     """Get administrators of a chat."""
     try:
         parsed_id = int(chat_id)
     except ValueError:
         parsed_id = chat_id
     result = await telegram.get_admins(parsed_id)
-    return make_response(result)
+    return make_etag_response(result, if_none_match)
 
 
 @app.post("/admin/promote", response_model=ApiResponse)
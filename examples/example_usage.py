@@ -9,43 +9,54 @@ Prerequisites:
 The client connects to the HTTP API running in Docker on port 8080.
 """
 
+import asyncio
 import sys
 import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from telegram_client import TelegramClient, TelegramClientError
+from telegram_client import AsyncTelegramClient, TelegramClientError
 
+try:
+    # Optional faster event loop: pip install uvloop
+    import uvloop
+except ImportError:
+    uvloop = None
 
-def main():
+
+async def main():
     # Create a client instance
-    client = TelegramClient(base_url="http://localhost:8080")
+    client = AsyncTelegramClient(base_url="http://localhost:8080")
 
     try:
+        # The calls are independent, so fetch them concurrently
+        health, me, chats, detailed_chats, contacts = await asyncio.gather(
+            client.health_check(),
+            client.get_me(),
+            client.get_chats(page=1, page_size=5),
+            client.list_chats(limit=5),
+            client.list_contacts(),
+        )
+
         # Check API health
-        health = client.health_check()
         print(f"API Health: {health}")
 
         # Get current user info
         print("\n--- Current User ---")
-        me = client.get_me()
         print(f"User: {me}")
 
         # List chats
         print("\n--- Recent Chats ---")
-        chats = client.get_chats(page=1, page_size=5)
         print(chats)
 
         # List chats with more details
         print("\n--- Chats with Metadata ---")
-        detailed_chats = client.list_chats(limit=5)
         for chat in detailed_chats:
             print(f"  - {chat.get('name')} (ID: {chat.get('id')}, Unread: {chat.get('unread_count', 0)})")
 
         # List contacts
         print("\n--- Contacts ---")
-        contacts = client.list_contacts()
         for contact in contacts[:5]:  # Show first 5
             print(f"  - {contact.get('name')} ({contact.get('username', 'no username')})")
 
@@ -56,8 +67,11 @@ def main():
         print("\nMake sure the Telegram API is running:")
         print("  docker compose up telegram-api")
     finally:
-        client.close()
+        await client.close()
 
 
 if __name__ == "__main__":
-    main()
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
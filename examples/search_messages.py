@@ -15,7 +15,7 @@ import json
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from telegram_client import TelegramClient, TelegramClientError
+from telegram_client import TelegramClientError, get_shared_client
 
 
 def main():
@@ -33,7 +33,7 @@ def main():
     except ValueError:
         pass
 
-    client = TelegramClient()
+    client = get_shared_client()
 
     try:
         print(f"Searching for '{query}' in chat {chat_id}...")
@@ -52,8 +52,6 @@ def main():
     except TelegramClientError as e:
         print(f"Error: {e}")
         sys.exit(1)
-    finally:
-        client.close()
 
 
 if __name__ == "__main__":
@@ -15,7 +15,7 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from telegram_client import TelegramClient, TelegramClientError
+from telegram_client import TelegramClientError, get_shared_client
 
 
 def main():
@@ -36,7 +36,7 @@ def main():
     except ValueError:
         pass  # Keep as string (username)
 
-    client = TelegramClient()
+    client = get_shared_client()
 
     try:
         result = client.send_message(chat_id=chat_id, message=message)
@@ -44,8 +44,6 @@ def main():
     except TelegramClientError as e:
         print(f"Error: {e}")
         sys.exit(1)
-    finally:
-        client.close()
 
 
 if __name__ == "__main__":
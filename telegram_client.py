@@ -8,6 +8,7 @@ Usage:
     from telegram_client import TelegramClient
 
     client = TelegramClient()  # Defaults to http://localhost:8080
+    # or reuse one pooled client per process: client = get_shared_client()
 
     # Get chats
     chats = client.get_chats()
@@ -16,13 +17,43 @@ Usage:
     client.send_message(chat_id=123456789, message="Hello!")
 """
 
-import json
+import asyncio
+import atexit
+import math
+import os
+import sqlite3
 import time
 import random
 import re
-from typing import Optional, List, Union, Any, Dict
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Tuple, Union, Any, Dict, Iterator, AsyncIterator
 from datetime import datetime, timedelta
 import httpx
+import msgspec
+import orjson
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+JSON_BODY_HEADERS = {"Content-Type": "application/json"}
+
+# Заголовки по умолчанию: сжатие ответов (httpx распаковывает их прозрачно)
+DEFAULT_HEADERS = {"Accept-Encoding": "br, gzip"}
+
+# Путь к дисковому кэшу GET-ответов (включается параметром cache_path)
+DEFAULT_CACHE_PATH = "~/.cache/telegram_client/responses.sqlite3"
+# Границы кэша: записи старше 7 дней и сверх 10 000 самых свежих удаляются
+RESPONSE_CACHE_MAX_AGE = 7 * 24 * 3600.0
+RESPONSE_CACHE_MAX_ENTRIES = 10_000
+
+# Максимальное время ожидания по FLOOD_WAIT и Retry-After (1 час)
+MAX_SERVER_WAIT = 3600.0
+
+# Сколько секунд результат health_check считается актуальным
+HEALTH_CACHE_TTL = 5.0
+
+# Максимальное число закэшированных username -> entity на один клиент
+RESOLVE_CACHE_SIZE = 1024
 
 
 class TelegramClientError(Exception):
@@ -45,8 +76,88 @@ class FloodWaitError(Exception):
         self.retry_after = wait_time  # Для совместимости с RateLimitError
 
 
-class TelegramClient:
-    """Client for interacting with the Telegram HTTP API."""
+class Envelope(msgspec.Struct):
+    """Response envelope of the Telegram HTTP API, decoded and validated in one pass."""
+
+    success: bool = False
+    data: Any = None
+    error: Optional[str] = None
+    error_code: Any = None
+    parameters: Any = None
+    next_cursor: Optional[str] = None
+
+
+class _ResponseCache:
+    """
+    On-disk store of GET payloads keyed by request, revalidated with ETags.
+
+    Entries not used for RESPONSE_CACHE_MAX_AGE are pruned, and at most
+    RESPONSE_CACHE_MAX_ENTRIES of the most recently used ones are kept.
+    """
+
+    def __init__(self, path: str):
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "etag TEXT NOT NULL, data BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+            )
+
+    def get(self, key: str) -> Optional[Tuple[str, Any]]:
+        """Return the cached (etag, data) pair for a key, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, data FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], orjson.loads(row[1])
+
+    def set(self, key: str, etag: str, data: Any):
+        """Store a payload together with its ETag, pruning old and excess entries."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, data, stored_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, etag, orjson.dumps(data), now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE stored_at < ?", (now - RESPONSE_CACHE_MAX_AGE,)
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key NOT IN "
+                "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                (RESPONSE_CACHE_MAX_ENTRIES,),
+            )
+
+    def touch(self, key: str):
+        """Mark an entry as just used after the server confirmed it is current."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key)
+            )
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class _BaseTelegramClient:
+    """Shared configuration and response handling for the sync and async clients."""
+
+    # Пути самых частых эндпоинтов (относительно base_url клиента)
+    _SEND_URL = "/messages/send"
+    _EDIT_URL = "/messages/edit"
+    _FORWARD_URL = "/messages/forward"
+    _SEARCH_URL = "/messages/search"
 
     def __init__(
         self,
@@ -54,6 +165,7 @@ class TelegramClient:
         timeout: float = 30.0,
         min_request_delay: float = 0.2,  # Минимальная задержка между запросами (5 req/s)
         max_retries: int = 3,
+        prefer_msgpack: bool = False,
     ):
         """
         Initialize the Telegram client.
@@ -63,12 +175,16 @@ class TelegramClient:
             timeout: Request timeout in seconds.
             min_request_delay: Минимальная задержка между запросами в секундах (по умолчанию 0.2 = 5 req/s).
             max_retries: Максимальное количество повторных попыток при ошибках.
+            prefer_msgpack: Ask the server for MessagePack instead of JSON.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.min_request_delay = min_request_delay
         self.max_retries = max_retries
-        self._client = httpx.Client(timeout=timeout)
+        self.prefer_msgpack = prefer_msgpack
+        self._headers = dict(DEFAULT_HEADERS)
+        if prefer_msgpack:
+            self._headers["Accept"] = f"{MSGPACK_CONTENT_TYPE}, application/json"
         
         # Отслеживание времени последнего запроса
         self._last_request_time: Optional[float] = None
@@ -80,32 +196,70 @@ class TelegramClient:
         self._last_edit_time: Optional[float] = None
         self._edit_count_last_hour: int = 0
         self._edit_count_reset_time: Optional[float] = None
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
-
-    def close(self):
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _wait_for_rate_limit(self):
-        """Ожидание перед следующим запросом для соблюдения rate limits."""
-        current_time = time.time()
         
-        if self._last_request_time is not None:
-            elapsed = current_time - self._last_request_time
-            if elapsed < self.min_request_delay:
-                sleep_time = self.min_request_delay - elapsed
-                # Добавляем небольшой jitter для избежания синхронизации
-                sleep_time += random.uniform(0, 0.05)
-                time.sleep(sleep_time)
+        # LRU-кэш разрешенных username (неизменны в пределах жизни скрипта)
+        self._resolved_usernames: "OrderedDict[str, Dict]" = OrderedDict()
         
-        self._last_request_time = time.time()
+        # Текущий пользователь не меняется за сессию; health кэшируется на HEALTH_CACHE_TTL
+        self._me_cache: Optional[Dict] = None
+        self._health_cache: Tuple[float, Optional[Dict]] = (0.0, None)
+        self._cache_lock = threading.Lock()
+
+    def _get_cached_health(self) -> Optional[Dict]:
+        """Return the last health check result if it is still fresh."""
+        checked_at, health = self._health_cache
+        if health is not None and time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+            return health
+        return None
+
+    def _set_cached_health(self, health: Dict):
+        """Remember a health check result."""
+        with self._cache_lock:
+            self._health_cache = (time.monotonic(), health)
+
+    def _set_cached_me(self, me: Dict):
+        """Remember the current user."""
+        with self._cache_lock:
+            self._me_cache = me
+
+    def _get_cached_entity(self, username: str) -> Optional[Dict]:
+        """Return a previously resolved entity for a username, if any."""
+        key = username.lstrip("@").lower()
+        with self._cache_lock:
+            entity = self._resolved_usernames.get(key)
+            if entity is not None:
+                self._resolved_usernames.move_to_end(key)
+        return entity
+
+    def _cache_entity(self, username: str, entity: Dict):
+        """Remember a resolved entity, evicting the least recently used one."""
+        with self._cache_lock:
+            self._resolved_usernames[username.lstrip("@").lower()] = entity
+            if len(self._resolved_usernames) > RESOLVE_CACHE_SIZE:
+                self._resolved_usernames.popitem(last=False)
+
+    @staticmethod
+    def _is_username(chat_id: Union[int, str]) -> bool:
+        """Check whether a chat reference is an @username."""
+        return isinstance(chat_id, str) and chat_id.startswith("@")
+
+    @staticmethod
+    def _peer_id(entity: Any, default: Union[int, str]) -> Union[int, str]:
+        """
+        Build a marked peer ID (as used by Telethon) from a resolved entity.
 
-    def _extract_flood_wait_time(self, error_msg: str, result: Dict) -> float:
+        Falls back to ``default`` when the entity has no usable ID.
+        """
+        if not isinstance(entity, dict) or not isinstance(entity.get("id"), int):
+            return default
+        entity_id = entity["id"]
+        if entity.get("type") == "group":
+            return -entity_id
+        if entity.get("type") == "channel":
+            return -(10**12) - entity_id
+        return entity_id
+
+    def _extract_flood_wait_time(self, error_msg: str, result: Envelope) -> float:
         """
         Извлечение времени ожидания из FLOOD_WAIT ошибки.
         
@@ -119,7 +273,7 @@ class TelegramClient:
         wait_time = 1.0  # По умолчанию 1 секунда
         
         # Пытаемся извлечь из parameters
-        parameters = result.get("parameters", {})
+        parameters = result.parameters
         if isinstance(parameters, dict):
             seconds = parameters.get("seconds") or parameters.get("retry_after")
             if seconds:
@@ -131,7 +285,7 @@ class TelegramClient:
             wait_time = float(match.group(1))
         
         # Ограничиваем максимальное время ожидания 3600 секундами (1 час)
-        wait_time = min(wait_time, 3600.0)
+        wait_time = min(wait_time, MAX_SERVER_WAIT)
         
         return wait_time
 
@@ -141,12 +295,15 @@ class TelegramClient:
         
         Returns:
             Время ожидания до следующей попытки в секундах.
+
+        Raises:
+            RateLimitError: Если Retry-After превышает MAX_SERVER_WAIT.
         """
         retry_after = 1.0  # По умолчанию 1 секунда
         
         try:
             # Пытаемся получить retry_after из ответа
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
             if isinstance(error_data, dict):
                 # Может быть в разных форматах
                 retry_after = error_data.get("retry_after", error_data.get("parameters", {}).get("retry_after", 1.0))
@@ -157,12 +314,28 @@ class TelegramClient:
         except (ValueError, KeyError, TypeError):
             pass
         
-        # Проверяем заголовки
+        # Проверяем заголовки: точное время от сервера соблюдаем без экспоненты,
+        # чтобы повтор ушел сразу по истечении окна по тому же keep-alive соединению
+        header_retry_after = None
         if "Retry-After" in response.headers:
             try:
-                retry_after = float(response.headers["Retry-After"])
+                header_retry_after = float(response.headers["Retry-After"])
             except (ValueError, TypeError):
                 pass
+            # inf/nan не годятся для sleep — считаем заголовок некорректным
+            if header_retry_after is not None and not math.isfinite(header_retry_after):
+                header_retry_after = None
+        
+        if header_retry_after is not None:
+            header_retry_after = max(header_retry_after, 0.0)
+            # Слишком долгое ожидание не делаем молча — сразу сообщаем вызывающему
+            if header_retry_after > MAX_SERVER_WAIT:
+                raise RateLimitError(
+                    f"Rate limit exceeded. Server asked to wait {header_retry_after:.1f} seconds.",
+                    retry_after=header_retry_after
+                )
+            # Без jitter и без экспоненты: повтор раньше срока получит еще один 429
+            return header_retry_after
         
         # Exponential backoff с jitter
         backoff_time = retry_after * (2 ** attempt)
@@ -175,6 +348,148 @@ class TelegramClient:
         
         return total_wait
 
+    def _failure_wait_time(self, result: Envelope, attempt: int) -> float:
+        """
+        Обработка неуспешного ответа API (success == False).
+
+        Returns:
+            Время ожидания перед повторной попыткой при FLOOD_WAIT.
+
+        Raises:
+            FloodWaitError: Если попытки исчерпаны.
+            TelegramClientError: Для всех остальных ошибок.
+        """
+        error_msg = result.error or "Unknown error"
+        error_code = result.error_code or ""
+        
+        # Обработка FLOOD_WAIT ошибки
+        if "FLOOD_WAIT" in str(error_code).upper() or "FLOOD_WAIT" in str(error_msg).upper():
+            wait_time = self._extract_flood_wait_time(error_msg, result)
+            
+            if attempt < self.max_retries:
+                # Автоматически ждем и повторяем
+                return wait_time + random.uniform(0, 1)  # Добавляем jitter
+            raise FloodWaitError(
+                f"Flood wait required: {error_msg}. "
+                f"Wait {wait_time:.1f} seconds before next request.",
+                wait_time=wait_time
+            )
+        
+        raise TelegramClientError(error_msg)
+
+    @staticmethod
+    def _messages_page_request(
+        chat_id: Union[int, str], page_size: int, cursor: Optional[str]
+    ) -> Tuple[str, Dict]:
+        """Build the endpoint and params for one keyset-paginated page of messages."""
+        params = {"page_size": page_size}
+        if cursor is not None:
+            params["cursor"] = cursor
+        return f"/chats/{chat_id}/messages", params
+
+    @staticmethod
+    def _split_message_lines(text: str) -> Iterator[str]:
+        """Split a get_messages page into entries, keeping multi-line message text together."""
+        entry = None
+        for line in text.split("\n"):
+            if line.startswith("ID: ") and entry is not None:
+                yield entry
+                entry = line
+            elif entry is None:
+                entry = line
+            else:
+                entry += "\n" + line
+        if entry is not None:
+            yield entry
+
+    @staticmethod
+    def _decode_response(response: httpx.Response) -> Envelope:
+        """Decode a response envelope from MessagePack or JSON based on its content type."""
+        try:
+            if response.headers.get("content-type", "").startswith(MSGPACK_CONTENT_TYPE):
+                return msgspec.msgpack.decode(response.content, type=Envelope)
+            return msgspec.json.decode(response.content, type=Envelope)
+        except msgspec.ValidationError as e:
+            raise TelegramClientError(f"Unexpected API response: {e}") from e
+
+    @staticmethod
+    def _unwrap_data(result: Envelope) -> Any:
+        """Extract the payload from a successful API response."""
+        data = result.data
+        # Сервер отдает JSON-данные как есть, повторный разбор не нужен
+        if isinstance(data, (dict, list)):
+            return data
+        # Старый формат: JSON, сериализованный в строку
+        if data and isinstance(data, (str, bytes)):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                return data
+        return data
+
+
+class TelegramClient(_BaseTelegramClient):
+    """Client for interacting with the Telegram HTTP API."""
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        timeout: float = 30.0,
+        min_request_delay: float = 0.2,
+        max_retries: int = 3,
+        prefer_msgpack: bool = False,
+        cache_path: Optional[str] = None,
+    ):
+        """
+        Initialize the Telegram client.
+
+        Args:
+            cache_path: SQLite file for caching GET responses that carry an ETag
+                (e.g. DEFAULT_CACHE_PATH). Cached entries are revalidated with
+                If-None-Match, so a 304 reply skips the download and parse.
+            Other arguments are described in _BaseTelegramClient.
+        """
+        super().__init__(base_url, timeout, min_request_delay, max_retries, prefer_msgpack)
+        self._cache = _ResponseCache(cache_path) if cache_path else None
+        # Один пул соединений на все эндпоинты: keep-alive + HTTP/2 мультиплексирование
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=30.0,
+            ),
+            headers=self._headers,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the HTTP client."""
+        self._client.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def _wait_for_rate_limit(self):
+        """Ожидание перед следующим запросом для соблюдения rate limits."""
+        current_time = time.time()
+        
+        if self._last_request_time is not None:
+            elapsed = current_time - self._last_request_time
+            if elapsed < self.min_request_delay:
+                sleep_time = self.min_request_delay - elapsed
+                # Добавляем небольшой jitter для избежания синхронизации
+                sleep_time += random.uniform(0, 0.05)
+                time.sleep(sleep_time)
+        
+        self._last_request_time = time.time()
+
     def _check_edit_rate_limit(self):
         """Проверка лимита редактирования (5 edits/s, 120 edits/hour)."""
         current_time = time.time()
@@ -224,6 +539,8 @@ class TelegramClient:
         check_message_rate_limit: bool = False,
         chat_id: Optional[Union[int, str]] = None,
         is_edit: bool = False,
+        cache_key: Optional[str] = None,
+        with_cursor: bool = False,
     ) -> Any:
         """
         Make an HTTP request to the API with rate limiting protection.
@@ -236,6 +553,8 @@ class TelegramClient:
             check_message_rate_limit: Проверять лимит сообщений для чата
             chat_id: ID чата для проверки лимита сообщений
             is_edit: Является ли запрос редактированием сообщения
+            cache_key: Ключ дискового кэша для условного запроса (If-None-Match)
+            with_cursor: Return a (data, next_cursor) tuple for paginated endpoints
         """
         # Проверка лимита редактирования
         if is_edit:
@@ -248,7 +567,14 @@ class TelegramClient:
         # Ожидание перед запросом для соблюдения общего rate limit
         self._wait_for_rate_limit()
         
-        url = f"{self.base_url}{endpoint}"
+        # Тело сериализуется один раз (orjson) и переиспользуется во всех попытках
+        body = orjson.dumps(json_data) if json_data is not None else None
+        headers = JSON_BODY_HEADERS if body is not None else None
+        
+        # Условный запрос: при неизменных данных сервер ответит 304 без тела
+        cached = self._cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            headers = {"If-None-Match": cached[0]}
         
         # Повторные попытки с exponential backoff
         last_exception = None
@@ -256,9 +582,10 @@ class TelegramClient:
             try:
                 response = self._client.request(
                     method=method,
-                    url=url,
+                    url=endpoint,
                     params=params,
-                    json=json_data,
+                    content=body,
+                    headers=headers,
                 )
                 
                 # Обработка ошибки 429 (Rate Limit)
@@ -275,37 +602,24 @@ class TelegramClient:
                             retry_after=wait_time
                         )
                 
+                if response.status_code == 304 and cached is not None:
+                    self._cache.touch(cache_key)
+                    return cached[1]
+                
                 response.raise_for_status()
                 
-                result = response.json()
+                result = self._decode_response(response)
                 
-                if not result.get("success"):
-                    error_msg = result.get("error", "Unknown error")
-                    error_code = result.get("error_code", "")
-                    
-                    # Обработка FLOOD_WAIT ошибки
-                    if "FLOOD_WAIT" in str(error_code).upper() or "FLOOD_WAIT" in str(error_msg).upper():
-                        wait_time = self._extract_flood_wait_time(error_msg, result)
-                        
-                        if attempt < self.max_retries:
-                            # Автоматически ждем и повторяем
-                            time.sleep(wait_time + random.uniform(0, 1))  # Добавляем jitter
-                            continue
-                        else:
-                            raise FloodWaitError(
-                                f"Flood wait required: {error_msg}. "
-                                f"Wait {wait_time:.1f} seconds before next request.",
-                                wait_time=wait_time
-                            )
-                    
-                    raise TelegramClientError(error_msg)
+                if not result.success:
+                    time.sleep(self._failure_wait_time(result, attempt))
+                    continue
                 
-                data = result.get("data")
-                if data:
-                    try:
-                        return json.loads(data)
-                    except (json.JSONDecodeError, TypeError):
-                        return data
+                data = self._unwrap_data(result)
+                etag = response.headers.get("ETag")
+                if cache_key is not None and etag:
+                    self._cache.set(cache_key, etag, data)
+                if with_cursor:
+                    return data, result.next_cursor
                 return data
                 
             except FloodWaitError as e:
@@ -335,11 +649,21 @@ class TelegramClient:
             raise last_exception
         raise TelegramClientError("Request failed after all retries")
 
-    def _get(self, endpoint: str, **params) -> Any:
-        """Make a GET request."""
-        return self._request("GET", endpoint, params=params)
+    def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Make a GET request, revalidating against the disk cache when enabled."""
+        cache_key = None
+        if self._cache is not None:
+            items = sorted(params.items()) if params else []
+            cache_key = orjson.dumps([self.base_url, endpoint, items]).decode()
+        return self._request("GET", endpoint, params=params, cache_key=cache_key)
 
-    def _post(self, endpoint: str, check_message_rate_limit: bool = False, chat_id: Optional[Union[int, str]] = None, **data) -> Any:
+    def _post(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        check_message_rate_limit: bool = False,
+        chat_id: Optional[Union[int, str]] = None,
+    ) -> Any:
         """Make a POST request."""
         return self._request(
             "POST",
@@ -349,29 +673,98 @@ class TelegramClient:
             chat_id=chat_id
         )
 
-    def _put(self, endpoint: str, is_edit: bool = False, **data) -> Any:
+    def _put(self, endpoint: str, data: Optional[Dict] = None, is_edit: bool = False) -> Any:
         """Make a PUT request."""
         return self._request("PUT", endpoint, json_data=data, is_edit=is_edit)
 
-    def _delete(self, endpoint: str, **data) -> Any:
+    def _delete(self, endpoint: str, data: Optional[Dict] = None) -> Any:
         """Make a DELETE request."""
-        if data:
-            return self._request("DELETE", endpoint, json_data=data)
-        return self._request("DELETE", endpoint)
+        # json=None не добавляет тело запроса, поэтому ветвление не нужно
+        return self._request("DELETE", endpoint, json_data=data)
+
+    def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+    ) -> Iterator[Any]:
+        """
+        Make a request that yields list rows as they arrive.
+
+        The server streams JSON Lines when it supports them; otherwise the
+        regular envelope is parsed and its list payload is yielded row by row.
+        """
+        self._wait_for_rate_limit()
+        
+        headers = {"Accept": NDJSON_CONTENT_TYPE}
+        body = None
+        if json_data is not None:
+            body = orjson.dumps(json_data)
+            headers.update(JSON_BODY_HEADERS)
+        
+        for attempt in range(self.max_retries + 1):
+            with self._client.stream(
+                method,
+                endpoint,
+                params=params,
+                content=body,
+                headers=headers,
+            ) as response:
+                # Обработка ошибки 429 (Rate Limit): до первой строки повтор безопасен
+                if response.status_code == 429:
+                    response.read()
+                    wait_time = self._handle_rate_limit_error(response, attempt)
+                    
+                    if attempt < self.max_retries:
+                        time.sleep(wait_time)
+                        continue
+                    raise RateLimitError(
+                        f"Rate limit exceeded after {self.max_retries} retries. "
+                        f"Wait {wait_time:.1f} seconds before next request.",
+                        retry_after=wait_time
+                    )
+                response.raise_for_status()
+                
+                if response.headers.get("content-type", "").startswith(NDJSON_CONTENT_TYPE):
+                    for line in response.iter_lines():
+                        if line:
+                            yield orjson.loads(line)
+                    return
+                
+                response.read()
+                result = self._decode_response(response)
+                break
+        
+        if not result.success:
+            # Без повторов: бросает FloodWaitError или TelegramClientError
+            self._failure_wait_time(result, self.max_retries)
+        
+        data = self._unwrap_data(result)
+        if isinstance(data, list):
+            yield from data
+
+    def _get_stream(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[Any]:
+        """Make a streaming GET request."""
+        return self._stream("GET", endpoint, params=params)
 
     # ==================== Health Check ====================
 
     def health_check(self) -> Dict:
-        """Check if the API is healthy."""
-        response = self._client.get(f"{self.base_url}/health")
-        response.raise_for_status()
-        return response.json()
+        """Check if the API is healthy (cached for a few seconds)."""
+        health = self._get_cached_health()
+        if health is None:
+            response = self._client.get("/health")
+            response.raise_for_status()
+            health = orjson.loads(response.content)
+            self._set_cached_health(health)
+        return health
 
     # ==================== Chat Operations ====================
 
     def get_chats(self, page: int = 1, page_size: int = 20) -> str:
         """Get a paginated list of chats."""
-        return self._get("/chats", page=page, page_size=page_size)
+        return self._get("/chats", {"page": page, "page_size": page_size})
 
     def list_chats(
         self,
@@ -384,7 +777,7 @@ class TelegramClient:
         params = {"limit": limit, "archived": archived, "unread_only": unread_only}
         if chat_type:
             params["chat_type"] = chat_type
-        return self._get("/chats/list", **params)
+        return self._get("/chats/list", params)
 
     def get_chat(self, chat_id: Union[int, str]) -> Dict:
         """Get detailed information about a specific chat."""
@@ -396,7 +789,36 @@ class TelegramClient:
         self, chat_id: Union[int, str], page: int = 1, page_size: int = 20
     ) -> str:
         """Get paginated messages from a chat."""
-        return self._get(f"/chats/{chat_id}/messages", page=page, page_size=page_size)
+        return self._get(f"/chats/{chat_id}/messages", {"page": page, "page_size": page_size})
+
+    def stream_messages(
+        self, chat_id: Union[int, str], page_size: int = 100
+    ) -> Iterator[str]:
+        """
+        Iterate over all messages of a chat, newest first.
+
+        Pages are fetched one at a time by cursor and each message line is
+        yielded before the next page is requested, so memory stays bounded
+        by a single page no matter how long the chat history is. Messages
+        arriving during the export do not shift page boundaries.
+        """
+        cursor = None
+        while True:
+            text, cursor = self._get_messages_page(chat_id, page_size, cursor)
+            if not isinstance(text, str) or not text.startswith("ID: "):
+                return
+            
+            yield from self._split_message_lines(text)
+            
+            if cursor is None:
+                return
+
+    def _get_messages_page(
+        self, chat_id: Union[int, str], page_size: int, cursor: Optional[str]
+    ) -> Tuple[Any, Optional[str]]:
+        """Fetch one keyset-paginated page of messages and the cursor of the next one."""
+        endpoint, params = self._messages_page_request(chat_id, page_size, cursor)
+        return self._request("GET", endpoint, params=params, with_cursor=True)
 
     def send_message(
         self,
@@ -406,14 +828,16 @@ class TelegramClient:
         parse_mode: Optional[str] = None,
     ) -> str:
         """Send a message to a chat with rate limiting protection."""
+        chat_id = self._resolve_chat_id(chat_id)
         data = {"chat_id": chat_id, "message": message}
         if reply_to:
             data["reply_to"] = reply_to
         if parse_mode:
             data["parse_mode"] = parse_mode
-        return self._post(
-            "/messages/send",
-            **data,
+        return self._request(
+            "POST",
+            self._SEND_URL,
+            json_data=data,
             check_message_rate_limit=True,
             chat_id=chat_id
         )
@@ -423,10 +847,8 @@ class TelegramClient:
     ) -> str:
         """Edit an existing message with rate limiting protection."""
         return self._put(
-            "/messages/edit",
-            chat_id=chat_id,
-            message_id=message_id,
-            new_text=new_text,
+            self._EDIT_URL,
+            {"chat_id": chat_id, "message_id": message_id, "new_text": new_text},
             is_edit=True
         )
 
@@ -436,20 +858,23 @@ class TelegramClient:
         """Delete a message."""
         return self._delete(
             "/messages/delete",
-            chat_id=chat_id,
-            message_id=message_id,
-            revoke=revoke,
+            {"chat_id": chat_id, "message_id": message_id, "revoke": revoke},
         )
 
     def forward_message(
         self, from_chat_id: Union[int, str], to_chat_id: Union[int, str], message_id: int
     ) -> str:
         """Forward a message from one chat to another with rate limiting protection."""
-        return self._post(
-            "/messages/forward",
-            from_chat_id=from_chat_id,
-            to_chat_id=to_chat_id,
-            message_id=message_id,
+        from_chat_id = self._resolve_chat_id(from_chat_id)
+        to_chat_id = self._resolve_chat_id(to_chat_id)
+        return self._request(
+            "POST",
+            self._FORWARD_URL,
+            json_data={
+                "from_chat_id": from_chat_id,
+                "to_chat_id": to_chat_id,
+                "message_id": message_id,
+            },
             check_message_rate_limit=True,
             chat_id=to_chat_id  # Лимит применяется к целевому чату
         )
@@ -462,10 +887,25 @@ class TelegramClient:
         from_user: Optional[Union[int, str]] = None,
     ) -> List[Dict]:
         """Search for messages in a chat."""
+        chat_id = self._resolve_chat_id(chat_id)
         data = {"chat_id": chat_id, "query": query, "limit": limit}
         if from_user:
             data["from_user"] = from_user
-        return self._post("/messages/search", **data)
+        return self._request("POST", self._SEARCH_URL, json_data=data)
+
+    def iter_search_messages(
+        self,
+        chat_id: Union[int, str],
+        query: str,
+        limit: int = 20,
+        from_user: Optional[Union[int, str]] = None,
+    ) -> Iterator[Dict]:
+        """Search for messages in a chat, yielding results as they arrive."""
+        chat_id = self._resolve_chat_id(chat_id)
+        data = {"chat_id": chat_id, "query": query, "limit": limit}
+        if from_user:
+            data["from_user"] = from_user
+        return self._stream("POST", self._SEARCH_URL, json_data=data)
 
     # ==================== Contact Operations ====================
 
@@ -473,9 +913,13 @@ class TelegramClient:
         """Get all contacts."""
         return self._get("/contacts")
 
+    def iter_contacts(self) -> Iterator[Dict]:
+        """Iterate over all contacts as they arrive."""
+        return self._get_stream("/contacts")
+
     def search_contacts(self, query: str, limit: int = 10) -> List[Dict]:
         """Search contacts by name or username."""
-        return self._get("/contacts/search", query=query, limit=limit)
+        return self._get("/contacts/search", {"query": query, "limit": limit})
 
     def add_contact(
         self, phone: str, first_name: str, last_name: Optional[str] = None
@@ -484,7 +928,7 @@ class TelegramClient:
         data = {"phone": phone, "first_name": first_name}
         if last_name:
             data["last_name"] = last_name
-        return self._post("/contacts", **data)
+        return self._post("/contacts", data)
 
     def delete_contact(self, user_id: Union[int, str]) -> str:
         """Delete a contact."""
@@ -493,28 +937,40 @@ class TelegramClient:
     # ==================== User Operations ====================
 
     def get_me(self) -> Dict:
-        """Get information about the current user."""
-        return self._get("/me")
+        """Get information about the current user (cached per client)."""
+        if self._me_cache is None:
+            self._set_cached_me(self._get("/me"))
+        return self._me_cache
 
     def get_user_status(self, user_id: Union[int, str]) -> Dict:
         """Get the online status of a user."""
         return self._get(f"/users/{user_id}/status")
 
     def resolve_username(self, username: str) -> Dict:
-        """Resolve a username to get entity information."""
-        return self._get(f"/resolve/{username}")
+        """Resolve a username to get entity information (cached per client)."""
+        entity = self._get_cached_entity(username)
+        if entity is None:
+            entity = self._get(f"/resolve/{username}")
+            self._cache_entity(username, entity)
+        return entity
+
+    def _resolve_chat_id(self, chat_id: Union[int, str]) -> Union[int, str]:
+        """Replace an @username with its numeric peer ID."""
+        if self._is_username(chat_id):
+            return self._peer_id(self.resolve_username(chat_id), chat_id)
+        return chat_id
 
     # ==================== Group Operations ====================
 
     def create_group(self, title: str, users: List[Union[int, str]]) -> str:
         """Create a new group chat."""
-        return self._post("/groups", title=title, users=users)
+        return self._post("/groups", {"title": title, "users": users})
 
     def invite_to_group(
         self, chat_id: Union[int, str], user_ids: List[Union[int, str]]
     ) -> str:
         """Invite users to a group or channel."""
-        return self._post("/groups/invite", chat_id=chat_id, user_ids=user_ids)
+        return self._post("/groups/invite", {"chat_id": chat_id, "user_ids": user_ids})
 
     def leave_chat(self, chat_id: Union[int, str]) -> str:
         """Leave a group or channel."""
@@ -524,7 +980,13 @@ class TelegramClient:
         self, chat_id: Union[int, str], limit: int = 100, offset: int = 0
     ) -> List[Dict]:
         """Get participants of a group or channel."""
-        return self._get(f"/chats/{chat_id}/participants", limit=limit, offset=offset)
+        return self._get(f"/chats/{chat_id}/participants", {"limit": limit, "offset": offset})
+
+    def iter_participants(
+        self, chat_id: Union[int, str], limit: int = 100, offset: int = 0
+    ) -> Iterator[Dict]:
+        """Iterate over participants of a group or channel as they arrive."""
+        return self._get_stream(f"/chats/{chat_id}/participants", {"limit": limit, "offset": offset})
 
     # ==================== Admin Operations ====================
 
@@ -542,7 +1004,7 @@ class TelegramClient:
         data = {"chat_id": chat_id, "user_id": user_id}
         if title:
             data["title"] = title
-        return self._post("/admin/promote", **data)
+        return self._post("/admin/promote", data)
 
     def ban_user(
         self,
@@ -554,11 +1016,11 @@ class TelegramClient:
         data = {"chat_id": chat_id, "user_id": user_id}
         if until_date:
             data["until_date"] = until_date
-        return self._post("/admin/ban", **data)
+        return self._post("/admin/ban", data)
 
     def unban_user(self, chat_id: Union[int, str], user_id: Union[int, str]) -> str:
         """Unban a user from a chat."""
-        return self._post("/admin/unban", chat_id=chat_id, user_id=user_id)
+        return self._post("/admin/unban", {"chat_id": chat_id, "user_id": user_id})
 
     # ==================== Channel Operations ====================
 
@@ -575,7 +1037,8 @@ class TelegramClient:
         params = {}
         if mute_until:
             params["mute_until"] = mute_until
-        return self._post(f"/chats/{chat_id}/mute", **params)
+        # mute_until передается в query string, как ожидает сервер
+        return self._request("POST", f"/chats/{chat_id}/mute", params=params)
 
     def unmute_chat(self, chat_id: Union[int, str]) -> str:
         """Unmute notifications for a chat."""
@@ -600,14 +1063,354 @@ class TelegramClient:
         data = {"chat_id": chat_id, "message": message}
         if reply_to:
             data["reply_to"] = reply_to
-        return self._post("/drafts/save", **data)
+        return self._post("/drafts/save", data)
 
     def clear_draft(self, chat_id: Union[int, str]) -> str:
         """Clear a draft from a chat."""
         return self._delete(f"/drafts/{chat_id}")
 
 
+
+class AsyncTelegramClient(_BaseTelegramClient):
+    """
+    Async client for the Telegram HTTP API.
+
+    Independent calls can be awaited concurrently and share one pooled
+    HTTP/2 connection:
+
+        async with AsyncTelegramClient() as client:
+            me, chats = await asyncio.gather(client.get_me(), client.get_chats())
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        timeout: float = 30.0,
+        min_request_delay: float = 0.2,
+        max_retries: int = 3,
+        prefer_msgpack: bool = False,
+    ):
+        super().__init__(base_url, timeout, min_request_delay, max_retries, prefer_msgpack)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=30.0,
+            ),
+            headers=self._headers,
+        )
+        self._rate_limit_lock = asyncio.Lock()
+        # Ограничение числа одновременных отправок в send_messages_bulk (~30 msg/s у Telegram)
+        self._send_semaphore = asyncio.Semaphore(30)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def _wait_for_rate_limit(self):
+        """Ожидание перед следующим запросом для соблюдения rate limits."""
+        # Под локом только резервируем слот, ожидание идет параллельно с другими запросами
+        async with self._rate_limit_lock:
+            current_time = time.time()
+            sleep_time = 0.0
+            
+            if self._last_request_time is not None:
+                elapsed = current_time - self._last_request_time
+                if elapsed < self.min_request_delay:
+                    sleep_time = self.min_request_delay - elapsed
+                    # Добавляем небольшой jitter для избежания синхронизации
+                    sleep_time += random.uniform(0, 0.05)
+            
+            self._last_request_time = current_time + sleep_time
+        
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+
+    async def _check_message_rate_limit(self, chat_id: Union[int, str]):
+        """Проверка лимита отправки сообщений (1 msg/s в один чат)."""
+        async with self._rate_limit_lock:
+            current_time = time.time()
+            sleep_time = 0.0
+            
+            if chat_id in self._last_message_time_per_chat:
+                elapsed = current_time - self._last_message_time_per_chat[chat_id]
+                if elapsed < 1.0:  # Минимум 1 секунда между сообщениями в один чат
+                    sleep_time = 1.0 - elapsed + random.uniform(0, 0.1)
+            
+            self._last_message_time_per_chat[chat_id] = current_time + sleep_time
+        
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+        check_message_rate_limit: bool = False,
+        chat_id: Optional[Union[int, str]] = None,
+        with_cursor: bool = False,
+    ) -> Any:
+        """
+        Make an HTTP request to the API with rate limiting protection.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            params: URL parameters
+            json_data: JSON body data
+            check_message_rate_limit: Проверять лимит сообщений для чата
+            chat_id: ID чата для проверки лимита сообщений
+            with_cursor: Return a (data, next_cursor) tuple for paginated endpoints
+        """
+        # Проверка лимита сообщений для конкретного чата
+        if check_message_rate_limit and chat_id is not None:
+            await self._check_message_rate_limit(chat_id)
+        
+        await self._wait_for_rate_limit()
+        
+        # Тело сериализуется один раз (orjson) и переиспользуется во всех попытках
+        body = orjson.dumps(json_data) if json_data is not None else None
+        headers = JSON_BODY_HEADERS if body is not None else None
+        
+        # Повторные попытки с exponential backoff
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=endpoint,
+                    params=params,
+                    content=body,
+                    headers=headers,
+                )
+                
+                # Обработка ошибки 429 (Rate Limit)
+                if response.status_code == 429:
+                    wait_time = self._handle_rate_limit_error(response, attempt)
+                    
+                    if attempt < self.max_retries:
+                        await asyncio.sleep(wait_time)
+                        continue
+                    raise RateLimitError(
+                        f"Rate limit exceeded after {self.max_retries} retries. "
+                        f"Wait {wait_time:.1f} seconds before next request.",
+                        retry_after=wait_time
+                    )
+                
+                response.raise_for_status()
+                
+                result = self._decode_response(response)
+                
+                if not result.success:
+                    await asyncio.sleep(self._failure_wait_time(result, attempt))
+                    continue
+                
+                if with_cursor:
+                    return self._unwrap_data(result), result.next_cursor
+                return self._unwrap_data(result)
+                
+            except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException):
+                if attempt < self.max_retries:
+                    # Exponential backoff для HTTP и сетевых ошибок
+                    await asyncio.sleep((2 ** attempt) + random.uniform(0, 1))
+                    continue
+                raise
+        
+        raise TelegramClientError("Request failed after all retries")
+
+    async def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Make a GET request."""
+        return await self._request("GET", endpoint, params=params)
+
+    async def _post(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        check_message_rate_limit: bool = False,
+        chat_id: Optional[Union[int, str]] = None,
+    ) -> Any:
+        """Make a POST request."""
+        return await self._request(
+            "POST",
+            endpoint,
+            json_data=data,
+            check_message_rate_limit=check_message_rate_limit,
+            chat_id=chat_id
+        )
+
+    # ==================== Health Check ====================
+
+    async def health_check(self) -> Dict:
+        """Check if the API is healthy (cached for a few seconds)."""
+        health = self._get_cached_health()
+        if health is None:
+            response = await self._client.get("/health")
+            response.raise_for_status()
+            health = orjson.loads(response.content)
+            self._set_cached_health(health)
+        return health
+
+    # ==================== Chat Operations ====================
+
+    async def get_chats(self, page: int = 1, page_size: int = 20) -> str:
+        """Get a paginated list of chats."""
+        return await self._get("/chats", {"page": page, "page_size": page_size})
+
+    async def list_chats(
+        self,
+        limit: int = 50,
+        chat_type: Optional[str] = None,
+        archived: bool = False,
+        unread_only: bool = False,
+    ) -> List[Dict]:
+        """Get a filtered list of chats with metadata."""
+        params = {"limit": limit, "archived": archived, "unread_only": unread_only}
+        if chat_type:
+            params["chat_type"] = chat_type
+        return await self._get("/chats/list", params)
+
+    # ==================== Message Operations ====================
+
+    async def _get_messages_page(
+        self, chat_id: Union[int, str], page_size: int, cursor: Optional[str]
+    ) -> Tuple[Any, Optional[str]]:
+        """Fetch one keyset-paginated page of messages and the cursor of the next one."""
+        endpoint, params = self._messages_page_request(chat_id, page_size, cursor)
+        return await self._request("GET", endpoint, params=params, with_cursor=True)
+
+    async def iter_messages(
+        self, chat_id: Union[int, str], page_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Iterate over all messages of a chat, newest first.
+
+        Uses cursor pagination and fetches the next page in the background
+        while the caller processes the current one.
+        """
+        task = asyncio.create_task(self._get_messages_page(chat_id, page_size, None))
+        try:
+            while task is not None:
+                text, cursor = await task
+                task = None
+                if cursor is not None:
+                    # Следующая страница грузится, пока вызывающий обрабатывает текущую
+                    task = asyncio.create_task(self._get_messages_page(chat_id, page_size, cursor))
+                if not isinstance(text, str) or not text.startswith("ID: "):
+                    return
+                for entry in self._split_message_lines(text):
+                    yield entry
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def send_message(
+        self,
+        chat_id: Union[int, str],
+        message: str,
+        reply_to: Optional[int] = None,
+        parse_mode: Optional[str] = None,
+    ) -> str:
+        """Send a message to a chat with rate limiting protection."""
+        chat_id = await self._resolve_chat_id(chat_id)
+        data = {"chat_id": chat_id, "message": message}
+        if reply_to:
+            data["reply_to"] = reply_to
+        if parse_mode:
+            data["parse_mode"] = parse_mode
+        return await self._post(
+            self._SEND_URL,
+            data,
+            check_message_rate_limit=True,
+            chat_id=chat_id
+        )
+
+    async def send_messages_bulk(self, items: List[Dict]) -> List[Union[str, BaseException]]:
+        """
+        Send many messages concurrently over the pooled connection.
+
+        Each item holds the keyword arguments of send_message. Per-chat and
+        global rate limits still apply; results keep the order of items.
+
+        A failed send does not abort the batch: its slot in the result list
+        holds the raised exception instead of the server reply, so callers
+        can retry only the failed items without re-sending delivered ones.
+        """
+        async def send(item: Dict) -> str:
+            async with self._send_semaphore:
+                return await self.send_message(**item)
+
+        return await asyncio.gather(*(send(item) for item in items), return_exceptions=True)
+
+    # ==================== Contact Operations ====================
+
+    async def list_contacts(self) -> List[Dict]:
+        """Get all contacts."""
+        return await self._get("/contacts")
+
+    # ==================== User Operations ====================
+
+    async def get_me(self) -> Dict:
+        """Get information about the current user (cached per client)."""
+        if self._me_cache is None:
+            self._set_cached_me(await self._get("/me"))
+        return self._me_cache
+
+    async def resolve_username(self, username: str) -> Dict:
+        """Resolve a username to get entity information (cached per client)."""
+        entity = self._get_cached_entity(username)
+        if entity is None:
+            entity = await self._get(f"/resolve/{username}")
+            self._cache_entity(username, entity)
+        return entity
+
+    async def _resolve_chat_id(self, chat_id: Union[int, str]) -> Union[int, str]:
+        """Replace an @username with its numeric peer ID."""
+        if self._is_username(chat_id):
+            return self._peer_id(await self.resolve_username(chat_id), chat_id)
+        return chat_id
+
+
 # Convenience function for quick usage
 def get_client(base_url: str = "http://localhost:8080") -> TelegramClient:
     """Get a Telegram client instance."""
     return TelegramClient(base_url=base_url)
+
+
+# Process-wide clients, one per base URL, closed at interpreter exit
+_shared_clients: Dict[str, TelegramClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(base_url: str = "http://localhost:8080") -> TelegramClient:
+    """
+    Get a process-wide Telegram client for the given API URL.
+
+    The client is created on first use and reused afterwards, so its
+    connection pool survives across callers. Do not close it manually.
+    """
+    key = base_url.rstrip("/")
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = TelegramClient(base_url=key)
+    return client
+
+
+@atexit.register
+def _close_shared_clients():
+    """Close all shared clients on interpreter exit."""
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for client in clients:
+        client.close()
@@ -13,7 +13,7 @@ import asyncio
 import random
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Tuple, Union, Any
 from functools import wraps
 
 from dotenv import load_dotenv
@@ -182,6 +182,21 @@ def format_entity(entity) -> Dict[str, Any]:
     return result
 
 
+def format_message_lines(messages) -> str:
+    """Format messages as one summary line each, as returned by get_messages."""
+    lines = []
+    for msg in messages:
+        sender_name = get_sender_name(msg)
+        reply_info = ""
+        if msg.reply_to and msg.reply_to.reply_to_msg_id:
+            reply_info = f" | reply to {msg.reply_to.reply_to_msg_id}"
+        engagement_info = get_engagement_info(msg)
+        lines.append(
+            f"ID: {msg.id} | {sender_name} | Date: {msg.date}{reply_info}{engagement_info} | Message: {msg.message}"
+        )
+    return "\n".join(lines)
+
+
 def format_message(message) -> Dict[str, Any]:
     """Helper function to format message information consistently."""
     result = {
@@ -427,20 +442,35 @@ class TelegramCore:
             messages = await self.client.get_messages(entity, limit=page_size, add_offset=offset)
             if not messages:
                 return "No messages found for this page."
-            lines = []
-            for msg in messages:
-                sender_name = get_sender_name(msg)
-                reply_info = ""
-                if msg.reply_to and msg.reply_to.reply_to_msg_id:
-                    reply_info = f" | reply to {msg.reply_to.reply_to_msg_id}"
-                engagement_info = get_engagement_info(msg)
-                lines.append(
-                    f"ID: {msg.id} | {sender_name} | Date: {msg.date}{reply_info}{engagement_info} | Message: {msg.message}"
-                )
-            return "\n".join(lines)
+            return format_message_lines(messages)
         except Exception as e:
             return log_and_format_error("get_messages", e, chat_id=chat_id, page=page)
 
+    async def get_messages_page(
+        self, chat_id: Union[int, str], page_size: int = 20, offset_id: Optional[int] = None
+    ) -> Tuple[str, Optional[int]]:
+        """
+        Get a page of messages older than offset_id (keyset pagination).
+
+        Returns the formatted page and the offset_id of the next page,
+        or None when there are no more messages.
+        """
+        chat_id, error = validate_ids("chat_id", chat_id)
+        if error:
+            return error, None
+
+        try:
+            entity = await self.client.get_entity(chat_id)
+            messages = await self.client.get_messages(
+                entity, limit=page_size, offset_id=offset_id or 0
+            )
+            if not messages:
+                return "No messages found for this page.", None
+            next_offset_id = messages[-1].id if len(messages) == page_size else None
+            return format_message_lines(messages), next_offset_id
+        except Exception as e:
+            return log_and_format_error("get_messages", e, chat_id=chat_id, offset_id=offset_id), None
+
     async def send_message(
         self,
         chat_id: Union[int, str],